@@ -4,19 +4,18 @@ Run:
     pip install -r requirements.txt
     pip install google-generativeai
     $env:GEMINI_API_KEY="your_actual_gemini_api_key_here"  # Windows PowerShell
+    $env:STUDY_BUDDY_PREWARM="1"  # optional: preload heavy libraries after first paint
     streamlit run app.py
 """
 
 import os
 import streamlit as st
-import pandas as pd
-import google.generativeai as genai
-import docx
-import PyPDF2
 import json
-# --- TTS FEATURE ---: Import necessary libraries for Text-to-Speech
-from gtts import gTTS
 from io import BytesIO
+from utils.startup import prewarm_enabled, start_prewarm
+
+# Heavy libraries (pandas, google.generativeai, PyPDF2, docx, gTTS) are imported
+# on the code paths that use them so the welcome page renders without them.
 
 # --- Utility Functions ---
 
@@ -24,6 +23,7 @@ def read_uploaded_file(uploaded_file):
     """Reads content from an uploaded file (.pdf, .docx, .txt)."""
     if uploaded_file.name.endswith(".pdf"):
         try:
+            import PyPDF2
             pdf_reader = PyPDF2.PdfReader(uploaded_file)
             text = ""
             for page in pdf_reader.pages:
@@ -33,6 +33,7 @@ def read_uploaded_file(uploaded_file):
             return f"Error reading PDF: {e}"
     elif uploaded_file.name.endswith(".docx"):
         try:
+            import docx
             doc = docx.Document(uploaded_file)
             return "\n".join([para.text for para in doc.paragraphs])
         except Exception as e:
@@ -48,6 +49,8 @@ def read_uploaded_file(uploaded_file):
 def text_to_audio_bytes(text: str):
     """Converts a text string to audio bytes using gTTS."""
     try:
+        # --- TTS FEATURE ---: gTTS is only needed once "Read Aloud" is clicked
+        from gtts import gTTS
         tts = gTTS(text=text, lang='en', slow=False)
         audio_fp = BytesIO()
         tts.write_to_fp(audio_fp)
@@ -132,18 +135,25 @@ def parse_plan_json(raw_json_text):
 
 # --- Main Streamlit App ---
 
-# Configure Gemini API key from environment
+# Check the Gemini API key up front; the client itself is configured on first use
 gemini_key = os.environ.get("GEMINI_API_KEY")
-if gemini_key:
-    genai.configure(api_key=gemini_key)
-else:
+if not gemini_key:
     st.error("GEMINI_API_KEY not set. Set it in your environment before running.")
     st.stop()
 
 
+@st.cache_resource
+def get_genai(api_key):
+    """Imports and configures the Gemini client once per process."""
+    import google.generativeai as genai
+    genai.configure(api_key=api_key)
+    return genai
+
+
 def call_gemini(prompt_text, max_tokens=4096, temperature=0.4):
     """Calls the Gemini API and handles responses without valid content."""
     try:
+        genai = get_genai(gemini_key)
         model = genai.GenerativeModel('gemini-flash-latest')
         response = model.generate_content(
             prompt_text,
@@ -363,9 +373,15 @@ else:
 
     if st.session_state.get("flashcards"):
         st.markdown("### Flashcards")
+        import pandas as pd
         df = pd.DataFrame(st.session_state.flashcards)
         st.dataframe(df, use_container_width=True)
         csv = df.to_csv(index=False).encode("utf-8")
         st.download_button("Download Flashcards (CSV)", csv, file_name="flashcards.csv")
     
 st.caption("Built with ❤️ - AI Study Buddy | Designed and Developed by Manolina Das")
+
+# Optional warm start: the page is already drawn, so load the heavy libraries
+# in the background before the user clicks an action.
+if prewarm_enabled():
+    start_prewarm()
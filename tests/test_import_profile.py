@@ -0,0 +1,59 @@
+import pytest
+
+from utils.import_profile import (
+    ImportTiming,
+    _check_module_name,
+    format_profile_report,
+    time_imports,
+)
+
+
+def test_time_imports_stdlib_module_gives_a_number():
+    timing = time_imports(["decimal"])
+    assert timing.micros is not None and timing.micros > 0
+    assert timing.reason == ""
+
+
+def test_time_imports_module_loaded_at_startup():
+    assert time_imports(["io"]) == ImportTiming(None, "already loaded at interpreter startup")
+
+
+def test_time_imports_missing_module():
+    assert time_imports(["no_such_module_xyz"]) == ImportTiming(None, "not installed")
+    assert time_imports(["no_such_module_xyz.sub"]) == ImportTiming(None, "not installed")
+
+
+def test_time_imports_broken_transitive_import(tmp_path, monkeypatch):
+    (tmp_path / "brokenmod.py").write_text("import missing_dep_xyz\n")
+    monkeypatch.setenv("PYTHONPATH", str(tmp_path))
+    timing = time_imports(["brokenmod"])
+    assert timing.micros is None
+    assert timing.reason.startswith("import failed:")
+    assert "missing_dep_xyz" in timing.reason
+
+
+def test_time_imports_keeps_number_when_one_module_is_missing():
+    timing = time_imports(["decimal", "no_such_module_xyz"])
+    assert timing.micros is not None and timing.micros > 0
+    assert timing.reason == "excludes no_such_module_xyz: not installed"
+
+
+def test_check_module_name_rejects_code():
+    with pytest.raises(ValueError):
+        _check_module_name("os; import x")
+    _check_module_name("google.generativeai")
+
+
+def test_format_profile_report_sorts_missing_timings_last():
+    report = format_profile_report(
+        ImportTiming(1500),
+        ImportTiming(3000),
+        {
+            "missing": ImportTiming(None, "not installed"),
+            "fast": ImportTiming(1000),
+            "slow": ImportTiming(2000),
+        },
+    )
+    lines = report.splitlines()
+    assert lines[0].endswith(": 1.5 ms")
+    assert [line.split()[0] for line in lines[-3:]] == ["slow", "fast", "missing"]
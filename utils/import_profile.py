@@ -0,0 +1,183 @@
+"""
+Import-time profile report for AI Study Buddy
+Measures how long startup imports and the deferred heavy libraries take.
+Run:
+    python -m utils.import_profile
+"""
+
+import os
+import re
+import subprocess
+import sys
+from typing import Dict, List, NamedTuple, Optional
+
+from utils.startup import HEAVY_MODULES
+
+# Modules app.py imports before drawing the welcome page.
+STARTUP_MODULES = [
+    "streamlit",
+    "json",
+    "io",
+    "utils.startup",
+]
+
+# Lines look like: "import time:  self [us] | cumulative | <indent>imported package"
+_IMPORTTIME_LINE = re.compile(r"import time:\s*\d+\s*\|\s*(\d+)\s*\|( +)(\S+)\s*$")
+_MARKER = "study-buddy-import"
+# Marker lines look like: "<marker> start <module>" or
+# "<marker> fail <module> <exception type> <missing module or -> <message>"
+_MARKER_LINE = re.compile(rf"{_MARKER} (start|fail) (\S+)(?: (\S+) (\S+) (.*))?$")
+_PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Runs in the child interpreter: imports each module named in sys.argv on its own,
+# writing a marker before it and a failure line if it cannot be imported.
+_CHILD_SCRIPT = f"""
+import sys
+for name in sys.argv[1:]:
+    sys.stderr.write("{_MARKER} start " + name + "\\n")
+    sys.stderr.flush()
+    try:
+        __import__(name)
+    except Exception as e:
+        missing = getattr(e, "name", None) if isinstance(e, ModuleNotFoundError) else None
+        message = str(e).replace("\\n", " ")
+        sys.stderr.write(
+            "{_MARKER} fail " + name + " " + type(e).__name__ + " " + (missing or "-") + " " + message + "\\n"
+        )
+        sys.stderr.flush()
+"""
+
+
+class ImportTiming(NamedTuple):
+    """Outcome of timing an import: microseconds, or None with the reason."""
+    micros: Optional[int]
+    reason: str = ""
+
+
+def _check_module_name(name: str):
+    """Raises ValueError unless name is a dotted Python module path."""
+    if not name or not all(part.isidentifier() for part in name.split(".")):
+        raise ValueError(f"Not a valid module name: {name!r}")
+
+
+def _failure_reason(name: str, exc_type: str, missing: str, message: str) -> str:
+    """
+    Returns "not installed" only when the requested module (or one of its
+    parent packages) is the one missing; anything else is an import failure.
+    """
+    if exc_type == "ModuleNotFoundError" and (name == missing or name.startswith(missing + ".")):
+        return "not installed"
+    return f"import failed: {exc_type}: {message}"
+
+
+def _parse_importtime(stderr: str):
+    """
+    Splits `-X importtime` output by module marker.
+    Returns (micros per module or None if nothing was imported, failure reason per module).
+    Only top-level lines count; their cumulative times include everything beneath them.
+    """
+    timings = {}
+    failures = {}
+    current = None
+    for line in stderr.splitlines():
+        marker = _MARKER_LINE.match(line)
+        if marker:
+            kind, name = marker.group(1), marker.group(2)
+            if kind == "start":
+                current = name
+                timings[name] = None
+            else:
+                failures[name] = _failure_reason(name, marker.group(3), marker.group(4), marker.group(5))
+            continue
+        match = _IMPORTTIME_LINE.match(line)
+        if current and match and len(match.group(2)) == 1:
+            timings[current] = (timings[current] or 0) + int(match.group(1))
+    return timings, failures
+
+
+def time_imports(modules: List[str]) -> ImportTiming:
+    """
+    Measures the time (in microseconds) to import the given modules one after
+    another in a single fresh interpreter using `python -X importtime`.
+    Shared dependencies are only counted once. Modules that fail to import are
+    left out of the number and named in the reason.
+    """
+    for name in modules:
+        _check_module_name(name)
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", _CHILD_SCRIPT, *modules],
+        capture_output=True,
+        text=True,
+        cwd=_PROJECT_ROOT,
+    )
+    if proc.returncode != 0:
+        errors = [line for line in proc.stderr.splitlines() if not _IMPORTTIME_LINE.match(line)]
+        return ImportTiming(None, f"import failed: {errors[-1] if errors else 'unknown error'}")
+
+    timings, failures = _parse_importtime(proc.stderr)
+    if len(modules) == 1 and failures:
+        return ImportTiming(None, failures[modules[0]])
+
+    failed = "; ".join(f"{name}: {reason}" for name, reason in failures.items())
+    imported = [timings.get(name) for name in modules if name not in failures]
+    if all(micros is None for micros in imported):
+        return ImportTiming(None, failed or "already loaded at interpreter startup")
+    total = sum(micros or 0 for micros in imported)
+    return ImportTiming(total, f"excludes {failed}" if failed else "")
+
+
+def profile_startup() -> ImportTiming:
+    """Measures the imports app.py pays for before the welcome page is drawn."""
+    return time_imports(STARTUP_MODULES)
+
+
+def profile_imports(modules: Optional[List[str]] = None) -> Dict[str, ImportTiming]:
+    """Measures each module on its own in a fresh interpreter."""
+    names = HEAVY_MODULES if modules is None else modules
+    return {name: time_imports([name]) for name in names}
+
+
+def _format_timing(timing: ImportTiming) -> str:
+    """Formats a timing in milliseconds, or its reason when there is no number."""
+    if timing.micros is None:
+        return timing.reason
+    text = f"{timing.micros / 1000:.1f} ms"
+    return f"{text} ({timing.reason})" if timing.reason else text
+
+
+def _slowest_first(item) -> int:
+    """Sort key for (name, ImportTiming) pairs; timings without a number sort last."""
+    return -1 if item[1].micros is None else item[1].micros
+
+
+def format_profile_report(
+    startup: ImportTiming,
+    combined: ImportTiming,
+    results: Dict[str, ImportTiming],
+) -> str:
+    """
+    Formats the import profile as plain text: the startup figure first,
+    then the deferred libraries loaded together and one by one, slowest first.
+    """
+    rows = [(name, _format_timing(timing)) for name, timing in sorted(results.items(), key=_slowest_first, reverse=True)]
+    name_width = max([len("module")] + [len(name) for name, _ in rows]) + 2
+    time_width = max([len("import time")] + [len(text) for _, text in rows])
+    lines = [
+        f"Startup imports ({', '.join(STARTUP_MODULES)}): {_format_timing(startup)}",
+        "",
+        f"Deferred libraries, loaded together: {_format_timing(combined)}",
+        f"{'module':<{name_width}}{'import time':>{time_width}}",
+    ]
+    for name, text in rows:
+        lines.append(f"{name:<{name_width}}{text:>{time_width}}")
+    return "\n".join(lines)
+
+
+if __name__ == "__main__":
+    modules = sys.argv[1:] or HEAVY_MODULES
+    try:
+        for name in modules:
+            _check_module_name(name)
+    except ValueError as e:
+        sys.exit(str(e))
+    print(format_profile_report(profile_startup(), time_imports(modules), profile_imports(modules)))
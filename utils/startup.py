@@ -0,0 +1,58 @@
+"""
+Startup helpers for AI Study Buddy
+Keeps heavy dependencies out of the first paint and can preload them afterwards.
+The import-time profile report lives in utils/import_profile.py.
+"""
+
+import os
+import threading
+from typing import List, Optional
+
+# Heavy modules that app.py only needs once the user acts on some material.
+HEAVY_MODULES = [
+    "google.generativeai",
+    "pandas",
+    "PyPDF2",
+    "docx",
+    "gtts",
+]
+
+PREWARM_ENV_VAR = "STUDY_BUDDY_PREWARM"
+
+_prewarm_started = False
+_prewarm_lock = threading.Lock()
+
+
+def _import_quietly(module_name: str):
+    """Imports a module, ignoring failures so a missing extra never breaks the UI."""
+    try:
+        __import__(module_name)
+    except Exception:
+        pass
+
+
+def prewarm_enabled() -> bool:
+    """Returns True if STUDY_BUDDY_PREWARM is set to a truthy value."""
+    return os.environ.get(PREWARM_ENV_VAR, "").strip().lower() in ("1", "true", "yes", "on")
+
+
+def start_prewarm(modules: Optional[List[str]] = None) -> bool:
+    """
+    Imports the heavy modules on a daemon thread, once per process.
+    Call it after the page has been drawn so the first paint is not delayed.
+    Returns True if this call started the thread, False otherwise.
+    """
+    global _prewarm_started
+    with _prewarm_lock:
+        if _prewarm_started:
+            return False
+        _prewarm_started = True
+
+    names = HEAVY_MODULES if modules is None else modules
+
+    def _run():
+        for name in names:
+            _import_quietly(name)
+
+    threading.Thread(target=_run, name="study-buddy-prewarm", daemon=True).start()
+    return True